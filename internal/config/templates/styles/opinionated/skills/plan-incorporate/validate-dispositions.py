@@ -14,7 +14,9 @@ Exit code 0 = PASS, exit code 1 = FAIL.
 
 import sys
 import re
+import mmap
 import argparse
+from functools import lru_cache
 from pathlib import Path
 
 # --- Shared parsing logic ---
@@ -28,36 +30,46 @@ from pathlib import Path
 #   ## 23. Round 1 Review Disposition
 #   ## 26a) Round 2 Review Disposition
 #   ## 16) Review Disposition
+# Matching is case-insensitive: the pattern is lowercase and is applied to
+# the lowercased line, which is cheaper than re.IGNORECASE case-folding.
 DISPOSITION_HEADER_RE = re.compile(
     r"^##\s+"
     r"(?:\d+[a-z]?[.)]\s*)?"  # Optional section number like "15) " or "23. " or "26a) "
-    r"(?:"
-    r"(?:Round\s+(\d+)\s+)?Review\s+Disposition"  # "Review Disposition" or "Round N Review Disposition"
-    r"|"
-    r"R(\d+)\s+Review\s+Disposition"  # "R1 Review Disposition"
-    r")"
-    r"\s*$",
-    re.IGNORECASE,
+    r"(?:(?:round\s+|r)(?P<round>\d+)\s+)?"  # Optional "Round N " or "RN "
+    r"review\s+disposition"
+    r"\s*$"
 )
 
+# Per-row pattern, compiled once instead of going through re's cache per call
+_CODE_SPAN_RE = re.compile(r"`[^`]+`")
+
+# Folds "," into "/" so compound severities split with a plain str.split
+_SEV_TRANS = str.maketrans({",": "/"})
+
+# find_disposition_tables scanner states
+_SEEK_HEADER = 0  # looking for a disposition section header
+_SKIP_BLANKS = 1  # skipping blank lines / prose until the table header row
+_EXPECT_SEP = 2  # header row seen, next line must be the separator
+_COLLECT_ROWS = 3  # collecting data rows until the first non-table line
+
 # Known first-column header names
-FIRST_COL_NAMES = {"finding id", "finding", "#", "id"}
+FIRST_COL_NAMES = frozenset({"finding id", "finding", "#", "id"})
 
 # Known column names (normalized lowercase)
-KNOWN_COLUMNS = {
+KNOWN_COLUMNS = frozenset({
     "finding id", "finding", "#", "id",
     "reviewer",
     "severity",
     "summary", "description",
     "disposition",
     "notes", "note", "comments", "comment",
-}
+})
 
 # Required columns (at least these must be present)
-REQUIRED_COLUMNS = {"severity", "disposition"}
+REQUIRED_COLUMNS = frozenset({"severity", "disposition"})
 
 # Recognized severity values (normalized lowercase, without leading/trailing whitespace)
-RECOGNIZED_SEVERITIES = {
+RECOGNIZED_SEVERITIES = frozenset({
     "p0", "p1", "p2", "p3",
     "critical", "blocker", "blocking",
     "high", "medium", "low",
@@ -65,10 +77,10 @@ RECOGNIZED_SEVERITIES = {
     "non-blocking", "nonblocking",
     "note", "question", "gap",
     "n/a", "none", "\u2014",  # em-dash, used in "no new findings" rows
-}
+})
 
 # Recognized disposition values (normalized lowercase)
-RECOGNIZED_DISPOSITIONS = {
+RECOGNIZED_DISPOSITIONS = frozenset({
     "incorporated",
     "incorporate",
     "not incorporated",
@@ -76,7 +88,7 @@ RECOGNIZED_DISPOSITIONS = {
     "already present",
     "acknowledged",
     "n/a",
-}
+})
 
 # Disposition values that start with these prefixes are also accepted
 # (e.g., "Incorporated (Option B)")
@@ -85,10 +97,16 @@ DISPOSITION_PREFIXES = [
     "incorporate",
     "not incorporated",
 ]
+_DISPOSITION_PREFIX_TUPLE = tuple(DISPOSITION_PREFIXES)
 
 
 def parse_table_row(line):
-    """Parse a markdown table row into cells. Returns list of stripped cell values."""
+    """
+    Parse a markdown table row into cells. Returns list of stripped cell values.
+
+    Cells come back already stripped, so downstream helpers (normalize_col_name,
+    classify_severity, classify_disposition) do not strip them again.
+    """
     line = line.strip()
     if not line.startswith("|"):
         return None
@@ -96,43 +114,48 @@ def parse_table_row(line):
     # 1. Escaped pipes (\|)
     # 2. Pipes inside backtick code spans (`...`)
     _PIPE_PH = "\x00PIPE\x00"
-    line = line.replace("\\|", _PIPE_PH)
-    line = re.sub(r'`[^`]+`', lambda m: m.group(0).replace("|", _PIPE_PH), line)
-    # Split on | and strip, ignoring leading/trailing empty splits
-    parts = line.split("|")
-    # Remove first and last empty strings from leading/trailing |
-    if parts and parts[0].strip() == "":
-        parts = parts[1:]
-    if parts and parts[-1].strip() == "":
-        parts = parts[:-1]
-    return [p.strip().replace(_PIPE_PH, "|") for p in parts]
+    protected = "\\|" in line or "`" in line
+    if protected:
+        line = line.replace("\\|", _PIPE_PH)
+        line = _CODE_SPAN_RE.sub(lambda m: m.group(0).replace("|", _PIPE_PH), line)
+    # Drop the leading | and any trailing |, then split once
+    inner = line[1:]
+    if not inner:
+        return []
+    if inner.endswith("|"):
+        inner = inner[:-1]
+    if protected:
+        return [p.strip().replace(_PIPE_PH, "|") for p in inner.split("|")]
+    return [p.strip() for p in inner.split("|")]
+
+
+def is_separator_cell(cell):
+    """Check if a cell is a separator cell (e.g., ---, :---, ---:, :---:)."""
+    if cell[:1] == ":":
+        cell = cell[1:]
+    if cell[-1:] == ":":
+        cell = cell[:-1]
+    return cell != "" and cell.strip("-") == ""
 
 
 def is_separator_row(cells):
     """Check if a row is a markdown table separator (e.g., |---|---|)."""
-    return all(re.match(r"^:?-+:?$", c) for c in cells)
+    return all(is_separator_cell(c) for c in cells)
 
 
 def normalize_col_name(name):
-    """Normalize a column header name for matching."""
-    return name.strip().lower()
-
-
-def find_column_index(headers, candidates):
-    """Find the index of a column matching any of the candidate names."""
-    for i, h in enumerate(headers):
-        if normalize_col_name(h) in candidates:
-            return i
-    return None
+    """Normalize a (pre-stripped) column header name for matching."""
+    return sys.intern(name.lower())
 
 
+@lru_cache(maxsize=1024)
 def classify_severity(val):
-    """Check if a severity value is recognized. Returns (is_valid, normalized_value)."""
-    v = val.strip().lower()
+    """Check if a (pre-stripped) severity value is recognized. Returns (is_valid, normalized_value)."""
+    v = val.lower()
     if v in RECOGNIZED_SEVERITIES:
         return True, v
     # Handle compound like "P0/Blocker"
-    parts = re.split(r"[/,]", v)
+    parts = v.translate(_SEV_TRANS).split("/")
     for p in parts:
         p = p.strip()
         if p in RECOGNIZED_SEVERITIES:
@@ -140,32 +163,34 @@ def classify_severity(val):
     return False, v
 
 
+@lru_cache(maxsize=1024)
 def classify_disposition(val):
-    """Check if a disposition value is recognized. Returns (is_valid, normalized_value)."""
-    v = val.strip().lower()
+    """Check if a (pre-stripped) disposition value is recognized. Returns (is_valid, normalized_value)."""
+    v = val.lower()
     if v in RECOGNIZED_DISPOSITIONS:
         return True, v
-    for prefix in DISPOSITION_PREFIXES:
-        if v.startswith(prefix):
-            return True, prefix
+    # One C-level startswith over all prefixes rejects most values up front
+    if v.startswith(_DISPOSITION_PREFIX_TUPLE):
+        for prefix in DISPOSITION_PREFIXES:
+            if v.startswith(prefix):
+                return True, prefix
     return False, v
 
 
 def extract_round_number(match):
     """Extract round number from a regex match on the disposition header."""
-    # Group 1 is from "Round N Review Disposition"
-    # Group 2 is from "RN Review Disposition"
-    if match.group(1):
-        return int(match.group(1))
-    if match.group(2):
-        return int(match.group(2))
+    # "round" is set by both "Round N Review Disposition" and "RN Review Disposition"
+    round_num = match.group("round")
+    if round_num:
+        return int(round_num)
     # No round number means it's the first/only round
     return None
 
 
 def find_disposition_tables(lines):
     """
-    Find all disposition tables in a list of lines.
+    Find all disposition tables in an iterable of lines (a list or an open
+    file). Lines are consumed lazily in a single pass.
 
     Returns a list of dicts:
     {
@@ -178,70 +203,69 @@ def find_disposition_tables(lines):
     }
     """
     tables = []
-    i = 0
-    while i < len(lines):
-        m = DISPOSITION_HEADER_RE.match(lines[i])
-        if m:
-            round_num = extract_round_number(m)
-            section_start = i
-            i += 1
-            # Skip blank lines and prose between header and table
-            while i < len(lines):
-                stripped = lines[i].strip()
-                if stripped == "":
-                    i += 1
+    # Bind hot lookups to locals for the per-line loop
+    header_match = DISPOSITION_HEADER_RE.match
+    parse_row = parse_table_row
+    is_sep = is_separator_row
+    state = _SEEK_HEADER
+    table = None
+    for line_no, line in enumerate(lines):
+        if state != _SEEK_HEADER:
+            if state == _COLLECT_ROWS:
+                row_cells = parse_row(line)
+                if row_cells is not None:
+                    # Separator rows inside a table are rare; a first cell that
+                    # can't start a separator rules one out without the full check
+                    if (row_cells and not row_cells[0].startswith(("-", ":-"))) or not is_sep(row_cells):
+                        table["rows"].append({"line": line_no, "cells": row_cells})
                     continue
-                if stripped.startswith("|"):
-                    break  # Found table start
-                if stripped.startswith("## "):
-                    break  # Hit next section header
-                i += 1  # Skip prose line
-                continue
-            # Look for the table header row
-            if i < len(lines):
-                header_cells = parse_table_row(lines[i])
+                # End of table; fall through since this line may be the next header
+                tables.append(table)
+                state = _SEEK_HEADER
+            elif state == _SKIP_BLANKS:
+                # Skip blank lines and prose between header and table, stopping
+                # at the table start or the next section header
+                if not line.strip().startswith(("|", "## ")):
+                    continue
+                header_cells = parse_row(line)
                 if header_cells:
-                    header_line = i
-                    i += 1
-                    # Next should be separator
-                    if i < len(lines):
-                        sep_cells = parse_table_row(lines[i])
-                        if sep_cells and is_separator_row(sep_cells):
-                            sep_line = i
-                            i += 1
-                            # Parse data rows
-                            rows = []
-                            while i < len(lines):
-                                row_cells = parse_table_row(lines[i])
-                                if row_cells is None:
-                                    break
-                                if is_separator_row(row_cells):
-                                    i += 1
-                                    continue
-                                rows.append({"line": i, "cells": row_cells})
-                                i += 1
-                            tables.append({
-                                "round": round_num,
-                                "header_line": header_line,
-                                "section_header_line": section_start,
-                                "header_cells": header_cells,
-                                "separator_line": sep_line,
-                                "rows": rows,
-                                "col_count": len(header_cells),
-                            })
-                            continue
-            # If we fell through, no valid table found after this header
-            # Still record it as a table with no rows (might be "No new findings")
-            tables.append({
-                "round": round_num,
-                "header_line": section_start,
-                "section_header_line": section_start,
+                    header_line = line_no
+                    state = _EXPECT_SEP
+                else:
+                    tables.append(table)
+                    state = _SEEK_HEADER
+                continue
+            else:  # _EXPECT_SEP
+                sep_cells = parse_row(line)
+                if sep_cells and is_sep(sep_cells):
+                    table["header_line"] = header_line
+                    table["header_cells"] = header_cells
+                    table["separator_line"] = line_no
+                    table["col_count"] = len(header_cells)
+                    state = _COLLECT_ROWS
+                else:
+                    tables.append(table)
+                    state = _SEEK_HEADER
+                continue
+        # Cheap prefix gate: only "##" lines can be disposition headers
+        if not line.startswith("##"):
+            continue
+        m = header_match(line.lower())
+        if m:
+            # Starts out as an empty table (might be "No new findings") and
+            # is filled in once a header row and separator are found
+            table = {
+                "round": extract_round_number(m),
+                "header_line": line_no,
+                "section_header_line": line_no,
                 "header_cells": [],
                 "separator_line": None,
                 "rows": [],
                 "col_count": 0,
-            })
-        i += 1
+            }
+            state = _SKIP_BLANKS
+    if state != _SEEK_HEADER:
+        tables.append(table)
     return tables
 
 
@@ -260,22 +284,28 @@ def validate_table(table):
         # This is OK - some rounds have no findings
         return errors
 
-    headers_lower = [normalize_col_name(h) for h in table["header_cells"]]
+    # Normalized column name -> index of its first occurrence
+    header_idx = {}
+    for i, h in enumerate(table["header_cells"]):
+        header_idx.setdefault(normalize_col_name(h), i)
 
     # Check for required columns
-    sev_idx = find_column_index(table["header_cells"], {"severity"})
-    disp_idx = find_column_index(table["header_cells"], {"disposition"})
-
-    if sev_idx is None:
-        errors.append(
-            f"{round_label} ({line_prefix}): Missing 'Severity' column. "
-            f"Found columns: {table['header_cells']}"
-        )
-    if disp_idx is None:
-        errors.append(
-            f"{round_label} ({line_prefix}): Missing 'Disposition' column. "
-            f"Found columns: {table['header_cells']}"
-        )
+    sev_idx = header_idx.get("severity")
+    disp_idx = header_idx.get("disposition")
+
+    if sev_idx is None or disp_idx is None:
+        # Render the header once for both missing-column errors
+        found_columns = "|".join(table["header_cells"])
+        if sev_idx is None:
+            errors.append(
+                f"{round_label} ({line_prefix}): Missing 'Severity' column. "
+                f"Found columns: {found_columns}"
+            )
+        if disp_idx is None:
+            errors.append(
+                f"{round_label} ({line_prefix}): Missing 'Disposition' column. "
+                f"Found columns: {found_columns}"
+            )
 
     if errors:
         # Can't validate rows without knowing column positions
@@ -317,6 +347,19 @@ def validate_table(table):
     return errors
 
 
+def may_contain_disposition_header(path):
+    """
+    Cheap whole-file pre-check: every disposition header starts with "##".
+
+    Searches a read-only memory map, so the file is never decoded or copied
+    onto the heap just to find out it has nothing to validate.
+    """
+    if path.stat().st_size == 0:
+        return False
+    with path.open("rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        return mm.find(b"##") != -1
+
+
 def validate_file(filepath):
     """
     Validate all disposition tables in a file.
@@ -329,10 +372,11 @@ def validate_file(filepath):
     if not path.is_file():
         return False, 0, [f"Not a file: {filepath}"]
 
-    text = path.read_text(encoding="utf-8")
-    lines = text.splitlines()
+    if not may_contain_disposition_header(path):
+        return True, 0, []  # No "##" headers at all, so nothing to scan
 
-    tables = find_disposition_tables(lines)
+    with path.open("r", encoding="utf-8") as f:
+        tables = find_disposition_tables(f)
     if not tables:
         return True, 0, []  # No tables is OK (file may not have been reviewed yet)
 
@@ -12,12 +12,24 @@ per-round totals, convergence table, and per-file breakdown.
 Shares parsing logic with validate-dispositions.py from the plan-incorporate skill.
 """
 
+import os
 import sys
 import re
 import json
 import argparse
 from pathlib import Path
-from collections import defaultdict
+from collections import Counter
+from itertools import chain
+from functools import lru_cache
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; format_json falls back to stdlib json
+    orjson = None
+
+# Below this much total markdown, parsing serially beats paying for process
+# pool startup (tens of ms under fork, well over 100 ms under spawn)
+_PARALLEL_MIN_BYTES = 2 * 1024 * 1024
 
 # --- Shared parsing logic (duplicated from validate-dispositions.py for standalone use) ---
 
@@ -33,6 +45,16 @@ DISPOSITION_HEADER_RE = re.compile(
     re.IGNORECASE,
 )
 
+# Splits compound severities like "P0/Blocker" or "P1, High"
+_SEV_SPLIT_RE = re.compile(r"[/,]")
+
+# Backtick code spans, whose pipes are not column delimiters
+_CODE_SPAN_RE = re.compile(r"`[^`]+`")
+
+# Necessary condition for any header match; lets files without one skip
+# decoding and the line scan. Runs on the raw file bytes.
+_HEADER_HINT_RE = re.compile(rb"disposition", re.IGNORECASE)
+
 RECOGNIZED_SEVERITIES = {
     "p0", "p1", "p2", "p3",
     "critical", "blocker", "blocking",
@@ -57,6 +79,14 @@ DISPOSITION_PREFIXES = [
     "not incorporated",
 ]
 
+# Column-name candidates for locating columns, built once instead of per table
+_SEV_CANDIDATES = frozenset({"severity"})
+_DISP_CANDIDATES = frozenset({"disposition"})
+_SUMMARY_CANDIDATES = frozenset({"summary", "description"})
+_REVIEWER_CANDIDATES = frozenset({"reviewer"})
+_NOTES_CANDIDATES = frozenset({"notes", "note", "comments", "comment"})
+_FINDING_CANDIDATES = frozenset({"finding id", "finding", "#", "id"})
+
 # Severity normalization map
 SEVERITY_MAP = {
     "p0": "P0", "critical": "P0", "blocker": "P0", "blocking": "P0",
@@ -71,6 +101,9 @@ SEVERITY_MAP = {
 
 
 def parse_table_row(line):
+    # Lines without a pipe can't be table rows; reject them before any copying
+    if "|" not in line:
+        return None
     line = line.strip()
     if not line.startswith("|"):
         return None
@@ -78,36 +111,45 @@ def parse_table_row(line):
     # 1. Escaped pipes (\|)
     # 2. Pipes inside backtick code spans (`...`)
     _PIPE_PH = "\x00PIPE\x00"
-    line = line.replace("\\|", _PIPE_PH)
-    line = re.sub(r'`[^`]+`', lambda m: m.group(0).replace("|", _PIPE_PH), line)
-    parts = line.split("|")
-    if parts and parts[0].strip() == "":
-        parts = parts[1:]
-    if parts and parts[-1].strip() == "":
-        parts = parts[:-1]
-    return [p.strip().replace(_PIPE_PH, "|") for p in parts]
+    protected = "\\|" in line or "`" in line
+    if protected:
+        line = line.replace("\\|", _PIPE_PH)
+        line = _CODE_SPAN_RE.sub(lambda m: m.group(0).replace("|", _PIPE_PH), line)
+    # Drop the leading | and any trailing |, then split once
+    inner = line[1:]
+    if not inner:
+        return []
+    if inner.endswith("|"):
+        inner = inner[:-1]
+    if protected:
+        return [p.strip().replace(_PIPE_PH, "|") for p in inner.split("|")]
+    return [p.strip() for p in inner.split("|")]
+
+
+def is_separator_cell(cell):
+    # ---, :---, ---: or :---: (at most one colon per side), without a regex
+    if cell[:1] == ":":
+        cell = cell[1:]
+    if cell[-1:] == ":":
+        cell = cell[:-1]
+    return cell != "" and cell.strip("-") == ""
 
 
 def is_separator_row(cells):
-    return all(re.match(r"^:?-+:?$", c) for c in cells)
+    return all(is_separator_cell(c) for c in cells)
 
 
+@lru_cache(maxsize=1024)
 def normalize_col_name(name):
     return name.strip().lower()
 
 
-def find_column_index(headers, candidates):
-    for i, h in enumerate(headers):
-        if normalize_col_name(h) in candidates:
-            return i
-    return None
-
-
+@lru_cache(maxsize=1024)
 def classify_severity(val):
     v = val.strip().lower()
     if v in RECOGNIZED_SEVERITIES:
         return True, v
-    parts = re.split(r"[/,]", v)
+    parts = _SEV_SPLIT_RE.split(v)
     for p in parts:
         p = p.strip()
         if p in RECOGNIZED_SEVERITIES:
@@ -115,6 +157,7 @@ def classify_severity(val):
     return False, v
 
 
+@lru_cache(maxsize=1024)
 def classify_disposition(val):
     v = val.strip().lower()
     if v in RECOGNIZED_DISPOSITIONS:
@@ -133,11 +176,12 @@ def extract_round_number(match):
     return None
 
 
+@lru_cache(maxsize=1024)
 def normalize_severity(raw):
     """Normalize a raw severity value to a canonical form (P0/P1/P2/P3/Info/N/A)."""
     v = raw.strip().lower()
     # Handle compound like "P0/Blocker"
-    parts = re.split(r"[/,]", v)
+    parts = _SEV_SPLIT_RE.split(v)
     for p in parts:
         p = p.strip()
         if p in SEVERITY_MAP:
@@ -147,6 +191,7 @@ def normalize_severity(raw):
     return raw.strip()
 
 
+@lru_cache(maxsize=1024)
 def normalize_disposition(raw):
     """Normalize a raw disposition value to Incorporated/Not Incorporated/Deferred/Other."""
     v = raw.strip().lower()
@@ -163,129 +208,119 @@ def normalize_disposition(raw):
     return raw.strip()
 
 
-def find_disposition_tables(lines):
-    tables = []
-    i = 0
-    while i < len(lines):
-        m = DISPOSITION_HEADER_RE.match(lines[i])
-        if m:
-            round_num = extract_round_number(m)
-            section_start = i
-            i += 1
-            # Skip blank lines and prose between header and table
-            while i < len(lines):
-                stripped = lines[i].strip()
-                if stripped == "":
-                    i += 1
-                    continue
-                if stripped.startswith("|"):
-                    break  # Found table start
-                if stripped.startswith("## "):
-                    break  # Hit next section header
-                i += 1  # Skip prose line
-                continue
-            if i < len(lines):
-                header_cells = parse_table_row(lines[i])
-                if header_cells:
-                    header_line = i
-                    i += 1
-                    if i < len(lines):
-                        sep_cells = parse_table_row(lines[i])
-                        if sep_cells and is_separator_row(sep_cells):
-                            sep_line = i
-                            i += 1
-                            rows = []
-                            while i < len(lines):
-                                row_cells = parse_table_row(lines[i])
-                                if row_cells is None:
-                                    break
-                                if is_separator_row(row_cells):
-                                    i += 1
-                                    continue
-                                rows.append({"line": i, "cells": row_cells})
-                                i += 1
-                            tables.append({
-                                "round": round_num,
-                                "header_line": header_line,
-                                "section_header_line": section_start,
-                                "header_cells": header_cells,
-                                "separator_line": sep_line,
-                                "rows": rows,
-                                "col_count": len(header_cells),
-                            })
-                            continue
-            tables.append({
-                "round": round_num,
-                "header_line": section_start,
-                "section_header_line": section_start,
-                "header_cells": [],
-                "separator_line": None,
-                "rows": [],
-                "col_count": 0,
-            })
-        i += 1
-    return tables
+def _line_at(data, pos):
+    """Decode the line starting at byte offset pos; return (line, offset of the next line)."""
+    end = data.find(b"\n", pos)
+    if end == -1:
+        end = len(data)
+    return data[pos:end].decode("utf-8"), end + 1
 
 
-# --- Aggregation logic ---
+def _next_header_candidate(data, pos):
+    """Byte offset of the first line at or after line start pos that begins with "##", or -1."""
+    if data.startswith(b"##", pos):
+        return pos
+    i = data.find(b"\n##", pos)
+    return i + 1 if i != -1 else -1
 
-def parse_file_findings(filepath):
+
+def _resolve_columns(header_cells):
     """
-    Parse all disposition tables in a file and extract structured findings.
+    Map a table header to (sev, disp, summary, reviewer, notes, finding) column
+    indices, or None if the severity or disposition column is missing.
+    """
+    # Normalized column name -> index of its first occurrence
+    header_index = {}
+    for i, h in enumerate(header_cells):
+        header_index.setdefault(normalize_col_name(h), i)
+
+    def find_column(candidates):
+        # Leftmost column matching any candidate, like a scan over the headers
+        return min((header_index[c] for c in candidates if c in header_index), default=None)
+
+    sev_idx = find_column(_SEV_CANDIDATES)
+    disp_idx = find_column(_DISP_CANDIDATES)
+    if sev_idx is None or disp_idx is None:
+        return None  # Can't parse without these columns
+    return (
+        sev_idx,
+        disp_idx,
+        find_column(_SUMMARY_CANDIDATES),
+        find_column(_REVIEWER_CANDIDATES),
+        find_column(_NOTES_CANDIDATES),
+        find_column(_FINDING_CANDIDATES),
+    )
 
-    Returns a list of dicts:
-    {
-        "file": str,
-        "round": int,
-        "finding_id": str,
-        "reviewer": str or None,
-        "severity": str (normalized),
-        "summary": str,
-        "disposition": str (normalized),
-        "notes": str,
-    }
+
+def iter_findings(data, filepath):
     """
-    path = Path(filepath)
-    text = path.read_text(encoding="utf-8")
-    lines = text.splitlines()
-    tables = find_disposition_tables(lines)
+    Scan a file's raw bytes for disposition tables and yield one finding dict
+    per table row (see parse_file_findings for the shape).
 
-    findings = []
+    Line boundaries are located with bytes.find, and a line is only decoded
+    when it is a "##" header candidate or follows a disposition header.
+    """
+    file_str = str(filepath)
     # Track rounds seen to assign round number to unlabeled tables
     unlabeled_round = 1
-
-    for table in tables:
-        if not table["header_cells"]:
+    size = len(data)
+    pos = _next_header_candidate(data, 0)
+    while pos != -1:
+        line, nxt = _line_at(data, pos)
+        m = DISPOSITION_HEADER_RE.match(line)
+        if not m:
+            pos = _next_header_candidate(data, nxt)
+            continue
+        round_num = extract_round_number(m)
+        pos = nxt
+        # Skip blank lines and prose between header and table
+        while pos < size:
+            line, nxt = _line_at(data, pos)
+            stripped = line.strip()
+            if stripped == "":
+                pos = nxt
+                continue
+            if stripped.startswith("|"):
+                break  # Found table start
+            if stripped.startswith("## "):
+                break  # Hit next section header
+            pos = nxt  # Skip prose line
+        if pos >= size:
+            break  # Header with no table before end of file
+        header_cells = parse_table_row(line)
+        pos = nxt
+        if not header_cells or pos >= size:
+            pos = _next_header_candidate(data, pos)
             continue  # Empty table (no findings this round)
+        line, nxt = _line_at(data, pos)
+        sep_cells = parse_table_row(line)
+        pos = nxt
+        if not (sep_cells and is_separator_row(sep_cells)):
+            pos = _next_header_candidate(data, pos)
+            continue
 
-        round_num = table["round"]
         if round_num is None:
             round_num = unlabeled_round
         unlabeled_round = max(unlabeled_round, round_num + 1)
 
-        headers_lower = [normalize_col_name(h) for h in table["header_cells"]]
-
-        # Find column indices
-        sev_idx = find_column_index(table["header_cells"], {"severity"})
-        disp_idx = find_column_index(table["header_cells"], {"disposition"})
-        summary_idx = find_column_index(table["header_cells"], {"summary", "description"})
-        reviewer_idx = find_column_index(table["header_cells"], {"reviewer"})
-        notes_idx = find_column_index(table["header_cells"], {"notes", "note", "comments", "comment"})
-        finding_idx = find_column_index(table["header_cells"], {"finding id", "finding", "#", "id"})
-
-        if sev_idx is None or disp_idx is None:
-            continue  # Can't parse without these columns
-
-        for row in table["rows"]:
-            cells = row["cells"]
-            if len(cells) != table["col_count"]:
-                continue  # Skip malformed rows
+        columns = _resolve_columns(header_cells)
+        if columns is not None:
+            sev_idx, disp_idx, summary_idx, reviewer_idx, notes_idx, finding_idx = columns
+        col_count = len(header_cells)
+        while pos < size:
+            line, nxt = _line_at(data, pos)
+            cells = parse_table_row(line)
+            if cells is None:
+                break
+            pos = nxt
+            if columns is None or len(cells) != col_count or is_separator_row(cells):
+                continue  # Unparseable table, malformed row, or separator
 
             raw_sev = cells[sev_idx]
             raw_disp = cells[disp_idx]
 
-            finding = {
-                "file": str(filepath),
+            yield {
+                "file": file_str,
                 "round": round_num,
                 "finding_id": cells[finding_idx] if finding_idx is not None else "",
                 "reviewer": cells[reviewer_idx] if reviewer_idx is not None else None,
@@ -296,9 +331,32 @@ def parse_file_findings(filepath):
                 "disposition_raw": raw_disp.strip(),
                 "notes": cells[notes_idx] if notes_idx is not None else "",
             }
-            findings.append(finding)
+        # The line that ended the table may itself be a header
+        pos = _next_header_candidate(data, pos)
+
+
+# --- Aggregation logic ---
+
+def parse_file_findings(filepath):
+    """
+    Parse all disposition tables in a file and extract structured findings.
 
-    return findings
+    Returns a list of dicts:
+    {
+        "file": str,
+        "round": int,
+        "finding_id": str,
+        "reviewer": str or None,
+        "severity": str (normalized),
+        "summary": str,
+        "disposition": str (normalized),
+        "notes": str,
+    }
+    """
+    data = Path(filepath).read_bytes()
+    if not _HEADER_HINT_RE.search(data):
+        return []  # No disposition header anywhere; skip decoding and scanning
+    return list(iter_findings(data, filepath))
 
 
 def aggregate_findings(findings):
@@ -311,50 +369,69 @@ def aggregate_findings(findings):
     - convergence: [{round, total, incorporated, not_incorporated, trend}]
     - per_file: {filepath: {total, by_round, by_severity, by_disposition}}
     """
-    per_round = defaultdict(lambda: {
-        "total": 0,
-        "by_severity": defaultdict(int),
-        "by_disposition": defaultdict(int),
-        "files": defaultdict(int),
-    })
-    per_file = defaultdict(lambda: {
-        "total": 0,
-        "by_round": defaultdict(int),
-        "by_severity": defaultdict(int),
-        "by_disposition": defaultdict(int),
-    })
-    overall = {
-        "total": 0,
-        "by_severity": defaultdict(int),
-        "by_disposition": defaultdict(int),
-    }
-
     # Severities that represent placeholder/non-finding rows
     PLACEHOLDER_SEVERITIES = {"N/A", "Info"}
 
+    # Count everything in one flat Counter keyed by (kind, ...) tuples;
+    # Counter.update tallies the whole batch for a finding in C.
+    counts = Counter()
     for f in findings:
-        rnd = f["round"]
         sev = f["severity"]
-        disp = f["disposition"]
-        fpath = f["file"]
 
         # Skip placeholder rows (N/A, Info) from all totals
         if sev in PLACEHOLDER_SEVERITIES:
             continue
 
-        per_round[rnd]["total"] += 1
-        per_round[rnd]["by_severity"][sev] += 1
-        per_round[rnd]["by_disposition"][disp] += 1
-        per_round[rnd]["files"][fpath] += 1
-
-        per_file[fpath]["total"] += 1
-        per_file[fpath]["by_round"][rnd] += 1
-        per_file[fpath]["by_severity"][sev] += 1
-        per_file[fpath]["by_disposition"][disp] += 1
-
-        overall["total"] += 1
-        overall["by_severity"][sev] += 1
-        overall["by_disposition"][disp] += 1
+        rnd = f["round"]
+        disp = f["disposition"]
+        fpath = f["file"]
+        counts.update((
+            ("round", rnd),
+            ("round_sev", rnd, sev),
+            ("round_disp", rnd, disp),
+            ("round_file", rnd, fpath),
+            ("file", fpath),
+            ("file_round", fpath, rnd),
+            ("file_sev", fpath, sev),
+            ("file_disp", fpath, disp),
+            ("total",),
+            ("sev", sev),
+            ("disp", disp),
+        ))
+
+    # Materialize the nested views. Counter keeps first-insertion order, so a
+    # ("round", rnd) / ("file", fpath) key always comes before its sub-keys.
+    per_round = {}
+    per_file = {}
+    overall = {
+        "total": 0,
+        "by_severity": {},
+        "by_disposition": {},
+    }
+    for key, n in counts.items():
+        kind = key[0]
+        if kind == "round":
+            per_round[key[1]] = {"total": n, "by_severity": {}, "by_disposition": {}, "files": {}}
+        elif kind == "round_sev":
+            per_round[key[1]]["by_severity"][key[2]] = n
+        elif kind == "round_disp":
+            per_round[key[1]]["by_disposition"][key[2]] = n
+        elif kind == "round_file":
+            per_round[key[1]]["files"][key[2]] = n
+        elif kind == "file":
+            per_file[key[1]] = {"total": n, "by_round": {}, "by_severity": {}, "by_disposition": {}}
+        elif kind == "file_round":
+            per_file[key[1]]["by_round"][key[2]] = n
+        elif kind == "file_sev":
+            per_file[key[1]]["by_severity"][key[2]] = n
+        elif kind == "file_disp":
+            per_file[key[1]]["by_disposition"][key[2]] = n
+        elif kind == "total":
+            overall["total"] = n
+        elif kind == "sev":
+            overall["by_severity"][key[1]] = n
+        else:  # "disp"
+            overall["by_disposition"][key[1]] = n
 
     # Build convergence table
     convergence = []
@@ -389,157 +466,134 @@ def aggregate_findings(findings):
         prev_total = total
 
     return {
-        "per_round": {k: dict(v) for k, v in per_round.items()},
+        "per_round": per_round,
         "overall": overall,
         "convergence": convergence,
-        "per_file": {k: dict(v) for k, v in per_file.items()},
+        "per_file": per_file,
     }
 
 
+# Canonical display order for normalized values; anything else sorts after
+SEV_ORDER = ("P0", "P1", "P2", "P3", "Info", "N/A")
+DISP_ORDER = ("Incorporated", "Not Incorporated", "Deferred", "N/A")
+
+
+def ordered_counts(counts, order):
+    """Yield (key, count) for nonzero counts: canonical order first, then the rest sorted."""
+    for key in order:
+        count = counts.get(key, 0)
+        if count > 0:
+            yield key, count
+    for key, count in sorted(counts.items()):
+        if key not in order and count > 0:
+            yield key, count
+
+
 def format_markdown(stats, findings):
     """Format aggregated stats as human-readable markdown."""
-    lines = []
-    lines.append("# Disposition Table Aggregate Summary")
-    lines.append("")
-
+    # Each block is one paragraph/table; blocks are separated by a blank line
+    blocks = []
     overall = stats["overall"]
-    lines.append(f"**Total findings across all files and rounds:** {overall['total']}")
-    lines.append("")
+    total = overall["total"]
+    rounds = sorted(stats["per_round"].keys())
+
+    blocks.append("# Disposition Table Aggregate Summary")
+    blocks.append(f"**Total findings across all files and rounds:** {total}")
 
     # Overall severity breakdown
-    lines.append("## Overall Severity Breakdown")
-    lines.append("")
-    lines.append("| Severity | Count | Percentage |")
-    lines.append("|----------|-------|------------|")
-    sev_order = ["P0", "P1", "P2", "P3", "Info", "N/A"]
-    for sev in sev_order:
-        count = overall["by_severity"].get(sev, 0)
-        if count > 0:
-            pct = (count / overall["total"] * 100) if overall["total"] > 0 else 0
-            lines.append(f"| {sev} | {count} | {pct:.1f}% |")
-    # Any unlisted severities
-    for sev, count in sorted(overall["by_severity"].items()):
-        if sev not in sev_order and count > 0:
-            pct = (count / overall["total"] * 100) if overall["total"] > 0 else 0
-            lines.append(f"| {sev} | {count} | {pct:.1f}% |")
-    lines.append("")
+    blocks.append("## Overall Severity Breakdown")
+    lines = ["| Severity | Count | Percentage |", "|----------|-------|------------|"]
+    lines.extend(
+        f"| {sev} | {count} | {count / total * 100:.1f}% |"
+        for sev, count in ordered_counts(overall["by_severity"], SEV_ORDER)
+    )
+    blocks.append("\n".join(lines))
 
     # Overall disposition breakdown
-    lines.append("## Overall Disposition Breakdown")
-    lines.append("")
-    lines.append("| Disposition | Count | Percentage |")
-    lines.append("|-------------|-------|------------|")
-    disp_order = ["Incorporated", "Not Incorporated", "Deferred", "N/A"]
-    for disp in disp_order:
-        count = overall["by_disposition"].get(disp, 0)
-        if count > 0:
-            pct = (count / overall["total"] * 100) if overall["total"] > 0 else 0
-            lines.append(f"| {disp} | {count} | {pct:.1f}% |")
-    for disp, count in sorted(overall["by_disposition"].items()):
-        if disp not in disp_order and count > 0:
-            pct = (count / overall["total"] * 100) if overall["total"] > 0 else 0
-            lines.append(f"| {disp} | {count} | {pct:.1f}% |")
-    lines.append("")
+    blocks.append("## Overall Disposition Breakdown")
+    lines = ["| Disposition | Count | Percentage |", "|-------------|-------|------------|"]
+    lines.extend(
+        f"| {disp} | {count} | {count / total * 100:.1f}% |"
+        for disp, count in ordered_counts(overall["by_disposition"], DISP_ORDER)
+    )
+    blocks.append("\n".join(lines))
 
     # Incorporation rate (excluding N/A findings)
-    real_findings = overall["total"] - overall["by_disposition"].get("N/A", 0)
+    real_findings = total - overall["by_disposition"].get("N/A", 0)
     real_incorporated = overall["by_disposition"].get("Incorporated", 0)
     if real_findings > 0:
         rate = (real_incorporated / real_findings) * 100
-        lines.append(f"**Incorporation rate (excluding N/A):** {real_incorporated}/{real_findings} ({rate:.1f}%)")
-        lines.append("")
+        blocks.append(f"**Incorporation rate (excluding N/A):** {real_incorporated}/{real_findings} ({rate:.1f}%)")
 
     # Convergence table
-    lines.append("## Convergence Table")
-    lines.append("")
-    lines.append("| Round | Total Findings | Incorporated | Not Incorporated | Deferred | N/A | Trend |")
-    lines.append("|-------|---------------|-------------|-----------------|----------|-----|-------|")
-    for c in stats["convergence"]:
-        lines.append(
-            f"| R{c['round']} | {c['total']} | {c['incorporated']} | "
-            f"{c['not_incorporated']} | {c['deferred']} | {c['na']} | {c['trend']} |"
-        )
-    lines.append("")
+    blocks.append("## Convergence Table")
+    lines = [
+        "| Round | Total Findings | Incorporated | Not Incorporated | Deferred | N/A | Trend |",
+        "|-------|---------------|-------------|-----------------|----------|-----|-------|",
+    ]
+    lines.extend(
+        f"| R{c['round']} | {c['total']} | {c['incorporated']} | "
+        f"{c['not_incorporated']} | {c['deferred']} | {c['na']} | {c['trend']} |"
+        for c in stats["convergence"]
+    )
+    blocks.append("\n".join(lines))
 
     # Per-round details
-    lines.append("## Per-Round Details")
-    lines.append("")
-    for rnd in sorted(stats["per_round"].keys()):
+    blocks.append("## Per-Round Details")
+    for rnd in rounds:
         rdata = stats["per_round"][rnd]
-        lines.append(f"### Round {rnd}")
-        lines.append("")
-        lines.append(f"**Total findings:** {rdata['total']}")
-        lines.append("")
+        blocks.append(f"### Round {rnd}")
+        blocks.append(f"**Total findings:** {rdata['total']}")
 
         # Severity
-        lines.append("| Severity | Count |")
-        lines.append("|----------|-------|")
-        for sev in sev_order:
-            count = rdata["by_severity"].get(sev, 0)
-            if count > 0:
-                lines.append(f"| {sev} | {count} |")
-        for sev, count in sorted(rdata["by_severity"].items()):
-            if sev not in sev_order and count > 0:
-                lines.append(f"| {sev} | {count} |")
-        lines.append("")
+        lines = ["| Severity | Count |", "|----------|-------|"]
+        lines.extend(f"| {sev} | {count} |" for sev, count in ordered_counts(rdata["by_severity"], SEV_ORDER))
+        blocks.append("\n".join(lines))
 
         # Disposition
-        lines.append("| Disposition | Count |")
-        lines.append("|-------------|-------|")
-        for disp in disp_order:
-            count = rdata["by_disposition"].get(disp, 0)
-            if count > 0:
-                lines.append(f"| {disp} | {count} |")
-        for disp, count in sorted(rdata["by_disposition"].items()):
-            if disp not in disp_order and count > 0:
-                lines.append(f"| {disp} | {count} |")
-        lines.append("")
+        lines = ["| Disposition | Count |", "|-------------|-------|"]
+        lines.extend(f"| {disp} | {count} |" for disp, count in ordered_counts(rdata["by_disposition"], DISP_ORDER))
+        blocks.append("\n".join(lines))
 
         # Files in this round
-        lines.append(f"**Files with findings:** {len(rdata['files'])}")
-        lines.append("")
+        blocks.append(f"**Files with findings:** {len(rdata['files'])}")
 
     # Per-file breakdown
-    lines.append("## Per-File Breakdown")
-    lines.append("")
-    lines.append("| File | Total | " + " | ".join(f"R{r}" for r in sorted(stats["per_round"].keys())) + " |")
-    sep = "|------|-------|" + "|".join("----" for _ in stats["per_round"]) + "|"
-    lines.append(sep)
+    blocks.append("## Per-File Breakdown")
+    lines = [
+        "| File | Total | " + " | ".join(f"R{r}" for r in rounds) + " |",
+        "|------|-------|" + "|".join("----" for _ in rounds) + "|",
+    ]
     for fpath in sorted(stats["per_file"].keys()):
         fdata = stats["per_file"][fpath]
-        fname = Path(fpath).name
-        row = f"| {fname} | {fdata['total']} |"
-        for rnd in sorted(stats["per_round"].keys()):
-            row += f" {fdata['by_round'].get(rnd, 0)} |"
-        lines.append(row)
-    lines.append("")
+        by_round = fdata["by_round"]
+        cells = [Path(fpath).name, str(fdata["total"])]
+        cells.extend(str(by_round.get(rnd, 0)) for rnd in rounds)
+        lines.append("| " + " | ".join(cells) + " |")
+    blocks.append("\n".join(lines))
 
-    return "\n".join(lines)
+    return "\n\n".join(blocks) + "\n"
 
 
 def format_json(stats, findings):
     """Format aggregated stats as JSON."""
-    # Convert defaultdicts to regular dicts for JSON serialization
-    def to_dict(obj):
-        if isinstance(obj, defaultdict):
-            return {k: to_dict(v) for k, v in obj.items()}
-        if isinstance(obj, dict):
-            return {k: to_dict(v) for k, v in obj.items()}
-        return obj
-
     output = {
-        "overall": to_dict(stats["overall"]),
+        "overall": stats["overall"],
         "convergence": stats["convergence"],
         "per_round": {},
         "per_file": {},
     }
 
     for rnd, rdata in sorted(stats["per_round"].items()):
-        output["per_round"][f"R{rnd}"] = to_dict(rdata)
+        output["per_round"][f"R{rnd}"] = rdata
 
     for fpath, fdata in sorted(stats["per_file"].items()):
-        output["per_file"][Path(fpath).name] = to_dict(fdata)
+        output["per_file"][Path(fpath).name] = fdata
 
+    if orjson is not None:
+        # Same text as the json.dumps call below; NON_STR_KEYS covers the
+        # int round numbers in by_round, which json.dumps stringifies itself
+        return orjson.dumps(output, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode()
     return json.dumps(output, indent=2, ensure_ascii=False)
 
 
@@ -562,14 +616,29 @@ def main():
     # Find all .md files recursively
     md_files = sorted(dirpath.rglob("*.md"))
 
-    all_findings = []
-    files_with_tables = 0
+    sizes = {p: p.stat().st_size for p in md_files}
+    if len(md_files) > 1 and sum(sizes.values()) >= _PARALLEL_MIN_BYTES:
+        # Files parse independently, so fan large inputs out across CPU cores.
+        # Hand files out largest first, so a big file doesn't start last and
+        # run on alone, in chunks of several files per task to keep IPC
+        # round-trips down. Results are put back in name order to keep the
+        # output deterministic.
+        # Imported here: concurrent.futures.process alone costs ~30 ms to load
+        from concurrent.futures import ProcessPoolExecutor
+
+        workers = min(os.cpu_count() or 1, len(md_files))
+        with ProcessPoolExecutor(max_workers=workers) as ex:
+            by_size = sorted(md_files, key=sizes.__getitem__, reverse=True)
+            # About four chunks per worker still leaves room to balance the tail
+            chunksize = max(1, len(by_size) // (workers * 4))
+            found = dict(zip(by_size, ex.map(parse_file_findings, by_size, chunksize=chunksize)))
+        results = [found[p] for p in md_files]
+    else:
+        results = [parse_file_findings(p) for p in md_files]
 
-    for md_file in md_files:
-        findings = parse_file_findings(md_file)
-        if findings:
-            files_with_tables += 1
-            all_findings.extend(findings)
+    # Flatten in one pass rather than growing a list with repeated extend()
+    all_findings = list(chain.from_iterable(results))
+    files_with_tables = sum(1 for r in results if r)
 
     if not all_findings:
         if args.format == "json":
@@ -15,17 +15,18 @@ import argparse
 import json
 import os
 from collections import defaultdict
-from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Dict, Iterable, Tuple
+from typing import Dict, Iterable, List, Tuple
 
+try:
+    from orjson import loads as json_loads
+except ImportError:  # orjson is optional; stdlib json.loads accepts bytes too
+    from json import loads as json_loads
 
-@dataclass
-class Totals:
-    input_tokens: int = 0
-    output_tokens: int = 0
-    turns: int = 0
+
+# Indices into a per-(day, model) totals list
+IN, OUT, TURNS = 0, 1, 2
 
 
 def parse_args() -> argparse.Namespace:
@@ -60,24 +61,33 @@ def load_command_fallback(session_dir: Path) -> str:
 
 
 def iter_events(path: Path) -> Iterable[dict]:
-    with path.open("r", encoding="utf-8") as fh:
+    # Read raw bytes: both JSON decoders take bytes and skip surrounding
+    # whitespace, so lines need no UTF-8 decode or strip() first.
+    with path.open("rb") as fh:
         for line in fh:
-            line = line.strip()
-            if not line:
+            if line.isspace():
                 continue
             try:
-                yield json.loads(line)
-            except json.JSONDecodeError:
+                yield json_loads(line)
+            except ValueError:  # JSONDecodeError (either decoder) or bad UTF-8
                 continue
 
 
 def parse_ts(raw: str) -> datetime | None:
     if not raw:
         return None
+    # Python 3.11+ parses a trailing "Z" itself; only fall back to rewriting
+    # it as "+00:00" (an extra string copy) when the direct parse fails.
     try:
-        return datetime.fromisoformat(raw.replace("Z", "+00:00"))
+        ts = datetime.fromisoformat(raw)
     except ValueError:
-        return None
+        try:
+            ts = datetime.fromisoformat(raw.replace("Z", "+00:00"))
+        except ValueError:
+            return None
+    # Always return an aware datetime (naive means local time) so callers can
+    # compare it with a UTC cutoff directly.
+    return ts if ts.tzinfo is not None else ts.astimezone()
 
 
 def main() -> int:
@@ -88,7 +98,7 @@ def main() -> int:
         raise SystemExit(f"sessions dir not found: {sessions_dir}")
 
     cutoff = datetime.now(timezone.utc) - timedelta(days=args.days)
-    totals: Dict[Tuple[str, str], Totals] = defaultdict(Totals)
+    totals: Dict[Tuple[str, str], List[int]] = defaultdict(lambda: [0, 0, 0])
 
     for session_dir in sorted(sessions_dir.glob("*-sand")):
         events_path = session_dir / "events.jsonl"
@@ -98,11 +108,15 @@ def main() -> int:
         current_model = load_command_fallback(session_dir)
         for event in iter_events(events_path):
             event_type = event.get("type")
+            # Only these two event types are counted; skip the rest (tool
+            # calls, messages, ...) before paying for timestamp parsing.
+            if event_type not in ("session_started", "turn_completed"):
+                continue
             data = event.get("data", {})
             ts = parse_ts(str(event.get("timestamp", "")))
             if ts is None:
                 continue
-            if ts.astimezone(timezone.utc) < cutoff:
+            if ts < cutoff:  # aware datetimes compare by instant, whatever the offset
                 continue
 
             if event_type == "session_started":
@@ -111,24 +125,20 @@ def main() -> int:
                     current_model = model
                 continue
 
-            if event_type != "turn_completed":
-                continue
-
+            # event_type == "turn_completed"
             in_tok = int(data.get("InputTokens", 0) or 0)
             out_tok = int(data.get("OutputTokens", 0) or 0)
             day = ts.date().isoformat()
             key = (day, current_model if current_model else "unknown")
             bucket = totals[key]
-            bucket.input_tokens += in_tok
-            bucket.output_tokens += out_tok
-            bucket.turns += 1
+            bucket[IN] += in_tok
+            bucket[OUT] += out_tok
+            bucket[TURNS] += 1
 
     print("date,model,input_tokens,output_tokens,turns")
     for day, model in sorted(totals.keys()):
-        bucket = totals[(day, model)]
-        print(
-            f"{day},{model},{bucket.input_tokens},{bucket.output_tokens},{bucket.turns}"
-        )
+        in_tok, out_tok, turns = totals[(day, model)]
+        print(f"{day},{model},{in_tok},{out_tok},{turns}")
 
     return 0
 